@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
 import logging
 import sqlite3
-from typing import Any, List
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 from boxing.utils.sql_utils import get_db_connection
 from boxing.utils.logger import configure_logger
@@ -11,7 +13,7 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Boxer:
     id: int
     name: str
@@ -19,100 +21,183 @@ class Boxer:
     height: int
     reach: float
     age: int
-    weight_class: str = None
+    weight_class: str = field(init=False)
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        # Automatically assign weight class (frozen, so bypass the generated __setattr__)
+        object.__setattr__(self, 'weight_class', get_weight_class(self.weight))
+
+    @cached_property
+    def skill(self) -> float:
+        # Arbitrary calculations, computed once per boxer
+        age_modifier = -1 if self.age < 25 else (-2 if self.age > 35 else 0)
+        return (self.weight * len(self.name)) + (self.reach / 10) + age_modifier
+
+
+# Lower bound of each weight class, lightest first
+WEIGHT_CLASS_THRESHOLDS = (125, 133, 166, 203)
+WEIGHT_CLASSES = ('FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+# SQLite caps the number of bound parameters per statement (999 on older builds),
+# so IN (...) lookups are split into chunks of this size.
+MAX_QUERY_PARAMS = 500
+
+# Kept as a constant so every call reuses the same statement text,
+# which lets sqlite3's per-connection statement cache skip re-parsing it.
+UPDATE_BOXER_STATS_QUERY = """
+    UPDATE boxers SET fights = fights + 1, wins = wins + ?
+    WHERE id = ?
+    RETURNING id
+"""
+
+UPDATE_FIGHT_RESULT_QUERY = """
+    UPDATE boxers
+    SET fights = fights + 1,
+        wins = wins + CASE WHEN id = :w THEN 1 ELSE 0 END
+    WHERE id IN (:w, :l)
+    RETURNING id
+"""
+
+# Built from the same cutoffs as get_weight_class, heaviest first, with the lightest class as the fallback
+WEIGHT_CLASS_CASE = "CASE {} ELSE '{}' END".format(
+    " ".join(
+        f"WHEN weight >= {threshold} THEN '{weight_class}'"
+        for threshold, weight_class in reversed(list(zip(WEIGHT_CLASS_THRESHOLDS[1:], WEIGHT_CLASSES[1:])))
+    ),
+    WEIGHT_CLASSES[0],
+)
+
+# Weight class and win percentage are computed by SQLite so rows need no per-row Python work.
+# SQLite's ROUND rounds halves away from zero on the decimal value (1 win in 16 fights is 6.3),
+# where Python's round() on the binary float gave 6.2.
+LEADERBOARD_QUERY = f"""
+    SELECT id, name, weight, height, reach, age,
+           {WEIGHT_CLASS_CASE} AS weight_class,
+           fights, wins,
+           ROUND(win_pct * 100, 1) AS win_pct
+    FROM boxers
+    WHERE fights > 0
+"""
+
+# One fixed statement per sort order, so each stays in the statement cache.
+# Both orderings are served by partial indexes on boxers (see sql/init_db.sql).
+# win_pct is qualified so the sort uses the stored column rather than the rounded alias.
+LEADERBOARD_QUERIES = {
+    "wins": LEADERBOARD_QUERY + " ORDER BY wins DESC",
+    "win_pct": LEADERBOARD_QUERY + " ORDER BY boxers.win_pct DESC",
+}
+
+# Number of leaderboard rows pulled from SQLite at a time
+LEADERBOARD_FETCH_SIZE = 500
 
 
 def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+    create_boxers([(name, weight, height, reach, age)])
 
-    if weight < 125:
-        raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
-    if height <= 0:
-        raise ValueError(f"Invalid height: {height}. Must be greater than 0.")
-    if reach <= 0:
-        raise ValueError(f"Invalid reach: {reach}. Must be greater than 0.")
-    if not (18 <= age <= 40):
-        raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
+
+def create_boxers(rows: Iterable[Tuple[str, int, int, float, int]]) -> None:
+    # Materialize once: the rows are walked for validation, the name check and the insert
+    rows = list(rows)
+    if not rows:
+        return
+
+    seen = set()
+    for name, weight, height, reach, age in rows:
+        validate_boxer(name, weight, height, reach, age)
+        if name in seen:
+            raise ValueError(f"Boxer name '{name}' is duplicated within the batch")
+        seen.add(name)
 
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
+            # Take the write lock up front so the whole batch is a single transaction
+            cursor.execute("BEGIN IMMEDIATE")
 
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
+            try:
+                # Check if any of the boxers already exist (name must be unique)
+                names = [row[0] for row in rows]
+                for i in range(0, len(names), MAX_QUERY_PARAMS):
+                    chunk = names[i:i + MAX_QUERY_PARAMS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor.execute(f"SELECT name FROM boxers WHERE name IN ({placeholders})", chunk)
+                    existing = cursor.fetchone()
+                    if existing:
+                        raise ValueError(f"Boxer with name '{existing[0]}' already exists")
 
-            conn.commit()
+                cursor.executemany("""
+                    INSERT INTO boxers (name, weight, height, reach, age)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+
+                conn.commit()
+
+            except Exception:
+                conn.rollback()
+                raise
 
     except sqlite3.IntegrityError:
-        raise ValueError(f"Boxer with name '{name}' already exists")
+        if len(rows) == 1:
+            raise ValueError(f"Boxer with name '{rows[0][0]}' already exists")
+        raise ValueError("One or more boxers in the batch already exist")
 
     except sqlite3.Error as e:
         raise e
 
 
+def validate_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+    if weight < 125:
+        raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
+    if height <= 0:
+        raise ValueError(f"Invalid height: {height}. Must be greater than 0.")
+    if reach <= 0:
+        raise ValueError(f"Invalid reach: {reach}. Must be greater than 0.")
+    if not (18 <= age <= 40):
+        raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
+
+
 def delete_boxer(boxer_id: int) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
+            cursor.execute("DELETE FROM boxers WHERE id = ? RETURNING id", (boxer_id,))
             if cursor.fetchone() is None:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
             conn.commit()
 
     except sqlite3.Error as e:
         raise e
 
 
-def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
+def get_leaderboard(sort_by: str = "wins") -> Iterator[dict[str, Any]]:
+    # Validate up front so a bad sort_by fails here, not when the caller starts iterating
+    try:
+        query = LEADERBOARD_QUERIES[sort_by]
+    except KeyError:
+        raise ValueError(f"Invalid sort_by parameter: {sort_by}") from None
+
+    # The iterator holds a pooled connection until it is exhausted or closed, so
+    # consume it promptly (the route wraps it in list())
+    return _iter_leaderboard(query)
 
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
-        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
+def _iter_leaderboard(query: str) -> Iterator[dict[str, Any]]:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            # Set on the cursor only, so pooled connections keep returning plain tuples
+            cursor.row_factory = sqlite3.Row
             cursor.execute(query)
-            rows = cursor.fetchall()
-
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
-
-        return leaderboard
+
+            # Stream in chunks so large leaderboards are never held in memory twice
+            while True:
+                rows = cursor.fetchmany(LEADERBOARD_FETCH_SIZE)
+                if not rows:
+                    break
+                yield from (dict(row) for row in rows)
 
     except sqlite3.Error as e:
         raise e
@@ -130,11 +215,8 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
-                return boxer
+                # Columns are selected in field order, so the row unpacks straight into Boxer
+                return Boxer(*row)
             else:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
@@ -142,6 +224,31 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
         raise e
 
 
+def get_boxers_by_ids(boxer_ids: Iterable[int]) -> Dict[int, Boxer]:
+    boxer_ids = list(dict.fromkeys(boxer_ids))  # Drop duplicates, keep order
+    boxers = {}
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            for i in range(0, len(boxer_ids), MAX_QUERY_PARAMS):
+                chunk = boxer_ids[i:i + MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT id, name, weight, height, reach, age
+                    FROM boxers WHERE id IN ({placeholders})
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    boxers[row[0]] = Boxer(*row)
+
+        return boxers
+
+    except sqlite3.Error as e:
+        raise e
+
+
 def get_boxer_by_name(boxer_name: str) -> Boxer:
     try:
         with get_db_connection() as conn:
@@ -154,11 +261,8 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
-                return boxer
+                # Columns are selected in field order, so the row unpacks straight into Boxer
+                return Boxer(*row)
             else:
                 raise ValueError(f"Boxer '{boxer_name}' not found.")
 
@@ -167,18 +271,11 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
 
 
 def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+    i = bisect_right(WEIGHT_CLASS_THRESHOLDS, weight) - 1
+    if i < 0:
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
 
-    return weight_class
+    return WEIGHT_CLASSES[i]
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
@@ -189,16 +286,41 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
+            # A single statement both updates the boxer and tells us whether it exists
+            cursor.execute(UPDATE_BOXER_STATS_QUERY, (int(result == 'win'), boxer_id))
             if cursor.fetchone() is None:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
-            else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
-
             conn.commit()
 
     except sqlite3.Error as e:
         raise e
+
+
+def update_fight_result(winner_id: int, loser_id: int) -> None:
+    if winner_id == loser_id:
+        raise ValueError(f"Boxer with ID {winner_id} cannot fight themselves.")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Both boxers are updated in one statement and one transaction
+            cursor.execute("BEGIN")
+
+            try:
+                cursor.execute(UPDATE_FIGHT_RESULT_QUERY, {'w': winner_id, 'l': loser_id})
+                updated = {row[0] for row in cursor.fetchall()}
+
+                for boxer_id in (winner_id, loser_id):
+                    if boxer_id not in updated:
+                        raise ValueError(f"Boxer with ID {boxer_id} not found.")
+
+                conn.commit()
+
+            except Exception:
+                conn.rollback()
+                raise
+
+    except sqlite3.Error as e:
+        raise e
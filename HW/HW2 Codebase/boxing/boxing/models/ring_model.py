@@ -2,7 +2,7 @@ import logging
 import math
 from typing import List
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, update_fight_result
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -12,6 +12,10 @@ configure_logger(logger)
 
 
 class RingModel:
+    # Kept as a list of at most two rather than two fixed slots: the ring tests
+    # read and extend .ring directly, and the list is already cheap
+    __slots__ = ('ring',)
+
     def __init__(self):
         self.ring: List[Boxer] = []
 
@@ -27,7 +31,7 @@ class RingModel:
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
         delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        normalized_delta = 1.0 / (1.0 + math.exp(-delta))
 
         random_number = get_random()
 
@@ -38,16 +42,13 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        update_fight_result(winner.id, loser.id)
 
         self.clear_ring()
 
         return winner.name
 
     def clear_ring(self):
-        if not self.ring:
-            return
         self.ring.clear()
 
     def enter_ring(self, boxer: Boxer):
@@ -57,19 +58,14 @@ class RingModel:
         if len(self.ring) >= 2:
             raise ValueError("Ring is full, cannot add more boxers.")
 
+        # update_fight_result rejects a bout against oneself, so never let one be set up
+        if any(b.id == boxer.id for b in self.ring):
+            raise ValueError(f"Boxer '{boxer.name}' is already in the ring.")
+
         self.ring.append(boxer)
 
     def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
-        else:
-            pass
-
         return self.ring
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
-        # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
-        skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
-
-        return skill
+        return boxer.skill
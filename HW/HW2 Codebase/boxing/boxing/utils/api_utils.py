@@ -1,6 +1,11 @@
+from collections import deque
 import logging
 import os
+import random
+from typing import List
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from boxing.utils.logger import configure_logger
 
@@ -10,24 +15,48 @@ configure_logger(logger)
 
 
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
-                           "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
+                           "https://www.random.org/decimal-fractions/?num=100&dec=2&col=1&format=plain&rnd=new")
+
+# The fight only samples a probability, so a local PRNG is good enough when random.org isn't wanted
+USE_LOCAL_RANDOM = os.getenv("USE_LOCAL_RANDOM", "false").lower() == "true"
+
+
+# Reuse TCP/TLS connections to random.org across calls
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Numbers fetched from random.org but not handed out yet
+_random_numbers = deque()
 
 
 def get_random() -> float:
+    if USE_LOCAL_RANDOM:
+        return random.random()
+
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        return _random_numbers.popleft()
+    except IndexError:
+        _random_numbers.extend(fetch_random_numbers())
+        return _random_numbers.popleft()
+
+
+def fetch_random_numbers() -> List[float]:
+    try:
+        response = _session.get(RANDOM_ORG_URL, timeout=5)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
-
+        # One number per line
         try:
-            random_number = float(random_number_str)
+            random_numbers = [float(number) for number in response.text.split()]
         except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
+            random_numbers = []
+
+        if not random_numbers:
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
 
-        return random_number
+        return random_numbers
 
     except requests.exceptions.Timeout:
         raise RuntimeError("Request to random.org timed out.")
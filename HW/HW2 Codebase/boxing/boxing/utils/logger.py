@@ -4,24 +4,26 @@ import sys
 from flask import current_app, has_request_context
 
 
-def configure_logger(logger):
-    logger.setLevel(logging.DEBUG)
+# Create a console handler that logs to stderr
+# It is shared by every logger so configuring a logger twice never adds a second copy
+handler = logging.StreamHandler(sys.stderr)
+handler.setLevel(logging.DEBUG)
+
+# Create a formatter with a timestamp
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    # Create a console handler that logs to stderr
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setLevel(logging.DEBUG)
+# Add the formatter to the handler
+handler.setFormatter(formatter)
 
-    # Create a formatter with a timestamp
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    # Add the formatter to the handler
-    handler.setFormatter(formatter)
+def configure_logger(logger):
+    logger.setLevel(logging.DEBUG)
 
-    # Add the handler to the logger
+    # Add the handler to the logger (addHandler skips handlers that are already attached)
     logger.addHandler(handler)
 
     # We also need to add the handler to the Flask logger
     if has_request_context():
         app_logger = current_app.logger
-        for handler in app_logger.handlers:
-            logger.addHandler(handler)
\ No newline at end of file
+        for app_handler in app_logger.handlers:
+            logger.addHandler(app_handler)
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 import logging
 import os
+import queue
 import sqlite3
+import threading
 
 from boxing.utils.logger import configure_logger
 
@@ -12,6 +14,22 @@ configure_logger(logger)
 
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+# Seconds to wait for a free pooled connection before giving up
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+
+# Applied once to every pooled connection. WAL with synchronous=NORMAL only syncs
+# at checkpoints instead of on every commit, which is what makes per-call commits cheap.
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",  # 256 MiB
+    "PRAGMA cache_size=-20000;",  # ~20 MB page cache
+)
+
+_pool = None
+_pool_lock = threading.Lock()
 
 
 def check_database_connection():
@@ -47,14 +65,76 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+def check_column_exists(tablename: str, columnname: str):
+    try:
+
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+
+        # table_xinfo (unlike table_info) also lists generated columns
+        cursor.execute("SELECT 1 FROM pragma_table_xinfo(?) WHERE name = ?;", (tablename, columnname))
+        result = cursor.fetchone()
+
+        conn.close()
+
+        if result is None:
+            error_message = (f"Column '{columnname}' does not exist in table '{tablename}'. "
+                             "The schema is out of date; recreate the database from sql/init_db.sql.")
+            raise Exception(error_message)
+
+    except sqlite3.Error as e:
+        error_message = f"Column check error for '{tablename}.{columnname}': {e}"
+        raise Exception(error_message) from e
+
+def _create_connection() -> sqlite3.Connection:
+    # check_same_thread is off because pooled connections move between request threads.
+    # isolation_level=None leaves transactions to explicit BEGIN/COMMIT in the models.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _get_pool() -> queue.Queue:
+    global _pool
+
+    # The pool is built on first use so importing this module never touches the database
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = queue.Queue(maxsize=DB_POOL_SIZE)
+                for _ in range(DB_POOL_SIZE):
+                    pool.put(_create_connection())
+                _pool = pool
+
+    return _pool
+
+def close_db_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            return
+
+        while not _pool.empty():
+            _pool.get_nowait().close()
+        _pool = None
+
 @contextmanager
 def get_db_connection():
-    conn = None
+    pool = _get_pool()
+    try:
+        conn = pool.get(timeout=DB_POOL_TIMEOUT)
+    except queue.Empty:
+        raise sqlite3.OperationalError(
+            f"No database connection available after {DB_POOL_TIMEOUT} seconds; "
+            f"all {DB_POOL_SIZE} pooled connections are in use."
+        ) from None
     try:
-        conn = sqlite3.connect(DB_PATH)
         yield conn
     except sqlite3.Error as e:
         raise e
     finally:
-        if conn:
-            conn.close()
+        # Never hand a connection with an open transaction back to the pool
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put(conn)
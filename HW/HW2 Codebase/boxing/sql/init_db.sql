@@ -1,3 +1,6 @@
+-- A database created before win_pct was added must be recreated from this script
+-- (SQLite cannot add a STORED generated column with ALTER TABLE).
+-- /api/db-check reports an out of date schema.
 DROP TABLE IF EXISTS boxers;
 CREATE TABLE boxers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -7,7 +10,12 @@ CREATE TABLE boxers (
     reach REAL CHECK (reach > 0),
     age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
     fights INTEGER DEFAULT 0 CHECK (fights >= 0),
-    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)  -- Wins cannot exceed fights
+    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights),  -- Wins cannot exceed fights
+    win_pct REAL GENERATED ALWAYS AS (CASE WHEN fights > 0 THEN wins * 1.0 / fights END) STORED
 );
 
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+
+-- Let the leaderboard read boxers in order instead of sorting them
+CREATE INDEX IF NOT EXISTS idx_boxers_wins ON boxers(wins DESC) WHERE fights > 0;
+CREATE INDEX IF NOT EXISTS idx_boxers_win_pct ON boxers(win_pct DESC) WHERE fights > 0;
@@ -0,0 +1,93 @@
+import pytest
+import requests
+
+from boxing.utils import api_utils
+from boxing.utils.api_utils import get_random, RANDOM_ORG_URL
+
+
+RANDOM_NUMBERS = [0.42, 0.17, 0.93]
+
+
+@pytest.fixture(autouse=True)
+def clear_random_numbers():
+    """Make sure every test starts without any buffered random numbers."""
+    api_utils._random_numbers.clear()
+    yield
+    api_utils._random_numbers.clear()
+
+@pytest.fixture
+def mock_random_org(mocker):
+    # Patch the session's get call
+    # _session.get returns an object, which we have replaced with a mock object
+    mock_response = mocker.Mock()
+    # We are giving that object a text attribute with one number per line
+    mock_response.text = "\n".join(str(number) for number in RANDOM_NUMBERS) + "\n"
+    mocker.patch.object(api_utils._session, "get", return_value=mock_response)
+    return mock_response
+
+def test_get_random(mock_random_org):
+    """Test retrieving a random number from random.org.
+
+    """
+    result = get_random()
+
+    # Assert that the result is the first mocked random number
+    assert result == RANDOM_NUMBERS[0], f"Expected random number {RANDOM_NUMBERS[0]}, but got {result}"
+
+    # Ensure that the correct URL was called
+    api_utils._session.get.assert_called_once_with(RANDOM_ORG_URL, timeout=5)
+
+def test_get_random_uses_buffer(mock_random_org):
+    """Test that one request to random.org serves a whole batch of numbers.
+
+    """
+    results = [get_random() for _ in RANDOM_NUMBERS]
+
+    assert results == RANDOM_NUMBERS, f"Expected {RANDOM_NUMBERS}, but got {results}"
+    api_utils._session.get.assert_called_once()
+
+    # The buffer is empty now, so the next call fetches a new batch
+    get_random()
+    assert api_utils._session.get.call_count == 2
+
+def test_get_random_local(mocker):
+    """Test that USE_LOCAL_RANDOM skips random.org entirely.
+
+    """
+    mocker.patch("boxing.utils.api_utils.USE_LOCAL_RANDOM", True)
+    mock_get = mocker.patch.object(api_utils._session, "get")
+
+    result = get_random()
+
+    assert 0 <= result < 1, f"Expected a number in [0, 1), but got {result}"
+    mock_get.assert_not_called()
+
+def test_get_random_request_failure(mocker):
+    """Test handling of a request failure when calling random.org.
+
+    """
+    # Simulate a request failure
+    mocker.patch.object(api_utils._session, "get", side_effect=requests.exceptions.RequestException("Connection error"))
+
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
+        get_random()
+
+def test_get_random_timeout(mocker):
+    """Test handling of a timeout when calling random.org.
+
+    """
+    # Simulate a timeout
+    mocker.patch.object(api_utils._session, "get", side_effect=requests.exceptions.Timeout)
+
+    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+        get_random()
+
+def test_get_random_invalid_response(mock_random_org):
+    """Test handling of an invalid response from random.org.
+
+    """
+    # Simulate an invalid response (non-numeric)
+    mock_random_org.text = "invalid_response"
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
+        get_random()
@@ -0,0 +1,568 @@
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+import re
+import sqlite3
+
+import pytest
+
+from boxing.models.boxers_model import (
+    Boxer,
+    create_boxer,
+    create_boxers,
+    delete_boxer,
+    get_leaderboard,
+    get_boxer_by_id,
+    get_boxer_by_name,
+    get_boxers_by_ids,
+    get_weight_class,
+    WEIGHT_CLASS_THRESHOLDS,
+    update_boxer_stats,
+    update_fight_result
+)
+from boxing.utils import sql_utils
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+def normalize_whitespace(sql_query: str) -> str:
+    return re.sub(r'\s+', ' ', sql_query).strip()
+
+# Mocking the database connection for tests
+@pytest.fixture
+def mock_cursor(mocker):
+    mock_conn = mocker.Mock()
+    mock_cursor = mocker.Mock()
+
+    # Mock the connection's cursor
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchmany.return_value = []
+    mock_cursor.commit.return_value = None
+
+    # Mock the get_db_connection context manager from sql_utils
+    @contextmanager
+    def mock_get_db_connection():
+        yield mock_conn  # Yield the mocked connection object
+
+    mocker.patch("boxing.models.boxers_model.get_db_connection", mock_get_db_connection)
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+# A real database built from sql/init_db.sql, for checks that depend on SQLite itself
+@pytest.fixture
+def real_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "boxing.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript((Path(__file__).parent.parent / "sql" / "init_db.sql").read_text())
+    conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", str(db_path))
+    monkeypatch.setattr(sql_utils, "_pool", None)
+    yield db_path
+    sql_utils.close_db_pool()
+
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+
+def test_create_boxer(mock_cursor):
+    """Test creating a new boxer.
+
+    """
+    create_boxer(name="Boxer 1", weight=150, height=180, reach=70.5, age=25)
+
+    expected_query = normalize_whitespace("""
+        INSERT INTO boxers (name, weight, height, reach, age)
+        VALUES (?, ?, ?, ?, ?)
+    """)
+    actual_query = normalize_whitespace(mock_cursor.executemany.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+
+    actual_arguments = mock_cursor.executemany.call_args[0][1]
+    expected_arguments = [("Boxer 1", 150, 180, 70.5, 25)]
+
+    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+
+
+def test_create_boxers(mock_cursor):
+    """Test creating a batch of boxers with a single transaction and insert.
+
+    """
+    rows = [
+        ("Boxer 1", 150, 180, 70.5, 25),
+        ("Boxer 2", 210, 190, 78.0, 30),
+    ]
+
+    create_boxers(rows)
+
+    actual_begin = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
+    assert actual_begin == "BEGIN IMMEDIATE", "Expected the batch to run in an immediate transaction."
+
+    expected_select = normalize_whitespace("SELECT name FROM boxers WHERE name IN (?, ?)")
+    actual_select = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+
+    assert actual_select == expected_select, "The name check query did not match the expected structure."
+    assert mock_cursor.execute.call_args_list[1][0][1] == ["Boxer 1", "Boxer 2"]
+
+    mock_cursor.executemany.assert_called_once()
+    assert mock_cursor.executemany.call_args[0][1] == rows
+
+
+def test_create_boxers_generator(mock_cursor):
+    """Test that a generator of rows is checked and inserted, not consumed by validation.
+
+    """
+    rows = [
+        ("Boxer 1", 150, 180, 70.5, 25),
+        ("Boxer 2", 210, 190, 78.0, 30),
+    ]
+
+    create_boxers(row for row in rows)
+
+    assert mock_cursor.execute.call_args_list[1][0][1] == ["Boxer 1", "Boxer 2"]
+    mock_cursor.executemany.assert_called_once()
+    assert mock_cursor.executemany.call_args[0][1] == rows
+
+
+def test_create_boxers_chunks_name_check(mock_cursor):
+    """Test that the existing name check is split to respect the bind parameter limit.
+
+    """
+    rows = [(f"Boxer {i}", 150, 180, 70.5, 25) for i in range(501)]
+
+    create_boxers(rows)
+
+    select_calls = [c for c in mock_cursor.execute.call_args_list if c[0][0].startswith("SELECT")]
+
+    assert len(select_calls) == 2, f"Expected 2 name check queries, got {len(select_calls)}"
+    assert len(select_calls[0][0][1]) == 500
+    assert len(select_calls[1][0][1]) == 1
+
+
+def test_create_boxers_empty(mock_cursor):
+    """Test that creating an empty batch does not touch the database.
+
+    """
+    create_boxers([])
+
+    mock_cursor.execute.assert_not_called()
+    mock_cursor.executemany.assert_not_called()
+
+
+def test_create_boxer_duplicate(mock_cursor):
+    """Test creating a boxer whose name already exists.
+
+    """
+    mock_cursor.fetchone.return_value = ("Boxer 1",)
+
+    with pytest.raises(ValueError, match="Boxer with name 'Boxer 1' already exists"):
+        create_boxer(name="Boxer 1", weight=150, height=180, reach=70.5, age=25)
+
+    mock_cursor.executemany.assert_not_called()
+
+
+def test_create_boxers_duplicate_in_batch(mock_cursor):
+    """Test that a batch containing the same name twice is rejected before hitting the database.
+
+    """
+    rows = [
+        ("Boxer 1", 150, 180, 70.5, 25),
+        ("Boxer 1", 210, 190, 78.0, 30),
+    ]
+
+    with pytest.raises(ValueError, match="Boxer name 'Boxer 1' is duplicated within the batch"):
+        create_boxers(rows)
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_create_boxer_integrity_error(mock_cursor):
+    """Test that an IntegrityError from the insert is reported as a duplicate.
+
+    """
+    mock_cursor.executemany.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed: boxers.name")
+
+    with pytest.raises(ValueError, match="Boxer with name 'Boxer 1' already exists"):
+        create_boxer(name="Boxer 1", weight=150, height=180, reach=70.5, age=25)
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"weight": 100}, "Invalid weight: 100. Must be at least 125."),
+    ({"height": 0}, "Invalid height: 0. Must be greater than 0."),
+    ({"reach": -1}, "Invalid reach: -1. Must be greater than 0."),
+    ({"age": 17}, "Invalid age: 17. Must be between 18 and 40."),
+])
+def test_create_boxer_invalid(mock_cursor, kwargs, message):
+    """Test error when creating a boxer with invalid attributes.
+
+    """
+    boxer = {"name": "Boxer 1", "weight": 150, "height": 180, "reach": 70.5, "age": 25}
+    boxer.update(kwargs)
+
+    with pytest.raises(ValueError, match=re.escape(message)):
+        create_boxer(**boxer)
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_delete_boxer(mock_cursor):
+    """Test deleting a boxer by ID.
+
+    """
+    mock_cursor.fetchone.return_value = (1,)
+
+    delete_boxer(1)
+
+    expected_delete_sql = normalize_whitespace("DELETE FROM boxers WHERE id = ? RETURNING id")
+    actual_delete_sql = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_delete_sql == expected_delete_sql, "The DELETE query did not match the expected structure."
+    assert mock_cursor.execute.call_args[0][1] == (1,)
+
+    # The existence check is folded into the DELETE
+    assert mock_cursor.execute.call_count == 1, "Expected a single SQL statement per delete."
+
+
+def test_delete_boxer_bad_id(mock_cursor):
+    """Test error when trying to delete a non-existent boxer.
+
+    """
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        delete_boxer(999)
+
+
+######################################################
+#
+#    Get Boxer
+#
+######################################################
+
+
+def test_get_boxer_by_id(mock_cursor):
+    """Test getting a boxer by ID.
+
+    """
+    mock_cursor.fetchone.return_value = (1, "Boxer 1", 150, 180, 70.5, 25)
+
+    result = get_boxer_by_id(1)
+
+    expected_result = Boxer(1, "Boxer 1", 150, 180, 70.5, 25)
+
+    assert result == expected_result, f"Expected {expected_result}, got {result}"
+    assert result.weight_class == "LIGHTWEIGHT"
+
+    assert mock_cursor.execute.call_args[0][1] == (1,)
+
+
+def test_get_boxer_by_id_bad_id(mock_cursor):
+    """Test error when getting a non-existent boxer.
+
+    """
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        get_boxer_by_id(999)
+
+
+def test_boxer_is_immutable():
+    """Test that boxers are frozen value objects that can be hashed.
+
+    """
+    boxer = Boxer(1, "Boxer 1", 150, 180, 70.5, 25)
+
+    with pytest.raises(FrozenInstanceError):
+        boxer.weight = 210
+
+    assert boxer.weight_class == "LIGHTWEIGHT"
+    assert hash(boxer) == hash(Boxer(1, "Boxer 1", 150, 180, 70.5, 25))
+
+
+def test_get_boxers_by_ids(mock_cursor):
+    """Test getting several boxers by ID with one query.
+
+    """
+    mock_cursor.fetchall.return_value = [
+        (1, "Boxer 1", 150, 180, 70.5, 25),
+        (2, "Boxer 2", 210, 190, 78.0, 30),
+    ]
+
+    result = get_boxers_by_ids([1, 2, 1])
+
+    assert result == {
+        1: Boxer(1, "Boxer 1", 150, 180, 70.5, 25),
+        2: Boxer(2, "Boxer 2", 210, 190, 78.0, 30),
+    }
+
+    expected_query = normalize_whitespace("SELECT id, name, weight, height, reach, age FROM boxers WHERE id IN (?, ?)")
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.execute.call_args[0][1] == [1, 2]
+    assert mock_cursor.execute.call_count == 1, "Expected a single query for all boxers."
+
+
+def test_get_boxers_by_ids_missing(mock_cursor):
+    """Test that IDs with no matching boxer are left out of the result.
+
+    """
+    mock_cursor.fetchall.return_value = [(1, "Boxer 1", 150, 180, 70.5, 25)]
+
+    result = get_boxers_by_ids([1, 999])
+
+    assert list(result) == [1]
+
+
+def test_get_boxers_by_ids_chunks_query(mock_cursor):
+    """Test that large ID lists are split to respect the bind parameter limit.
+
+    """
+    get_boxers_by_ids(range(1, 502))
+
+    assert mock_cursor.execute.call_count == 2, f"Expected 2 queries, got {mock_cursor.execute.call_count}"
+    assert len(mock_cursor.execute.call_args_list[0][0][1]) == 500
+    assert len(mock_cursor.execute.call_args_list[1][0][1]) == 1
+
+
+def test_get_boxer_by_name(mock_cursor):
+    """Test getting a boxer by name.
+
+    """
+    mock_cursor.fetchone.return_value = (1, "Boxer 1", 150, 180, 70.5, 25)
+
+    result = get_boxer_by_name("Boxer 1")
+
+    expected_result = Boxer(1, "Boxer 1", 150, 180, 70.5, 25)
+
+    assert result == expected_result, f"Expected {expected_result}, got {result}"
+
+    assert mock_cursor.execute.call_args[0][1] == ("Boxer 1",)
+
+
+def test_get_boxer_by_name_bad_name(mock_cursor):
+    """Test error when getting a boxer by a name that does not exist.
+
+    """
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer 'Nobody' not found."):
+        get_boxer_by_name("Nobody")
+
+
+@pytest.mark.parametrize("weight, expected", [
+    (125, "FEATHERWEIGHT"),
+    (132, "FEATHERWEIGHT"),
+    (133, "LIGHTWEIGHT"),
+    (166, "MIDDLEWEIGHT"),
+    (202.5, "MIDDLEWEIGHT"),
+    (203, "HEAVYWEIGHT"),
+    (300, "HEAVYWEIGHT"),
+])
+def test_get_weight_class(weight, expected):
+    """Test mapping weights to weight classes.
+
+    """
+    assert get_weight_class(weight) == expected
+
+
+def test_get_weight_class_invalid():
+    """Test error when the weight is below the lightest weight class.
+
+    """
+    with pytest.raises(ValueError, match="Invalid weight: 124. Weight must be at least 125."):
+        get_weight_class(124)
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+def test_get_leaderboard(mock_cursor):
+    """Test getting the leaderboard sorted by wins.
+
+    """
+    # sqlite3.Row is a mapping, so plain dicts stand in for the rows here
+    mock_cursor.fetchmany.side_effect = [
+        [{"id": 2, "name": "Boxer 2", "weight": 210, "height": 190, "reach": 78.0, "age": 30,
+          "weight_class": "HEAVYWEIGHT", "fights": 10, "wins": 8, "win_pct": 80.0}],
+        [{"id": 1, "name": "Boxer 1", "weight": 150, "height": 180, "reach": 70.5, "age": 25,
+          "weight_class": "LIGHTWEIGHT", "fights": 4, "wins": 1, "win_pct": 25.0}],
+        [],
+    ]
+
+    leaderboard = list(get_leaderboard())
+
+    assert [boxer["id"] for boxer in leaderboard] == [2, 1]
+    assert leaderboard[0] == {
+        "id": 2, "name": "Boxer 2", "weight": 210, "height": 190, "reach": 78.0, "age": 30,
+        "weight_class": "HEAVYWEIGHT", "fights": 10, "wins": 8, "win_pct": 80.0
+    }
+    assert all(type(boxer) is dict for boxer in leaderboard), "Expected rows to be converted to dicts."
+    assert mock_cursor.row_factory is sqlite3.Row
+
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert "ROUND(win_pct * 100, 1) AS win_pct" in actual_query, "Expected win_pct to be computed in SQL."
+    assert "AS weight_class" in actual_query, "Expected weight_class to be computed in SQL."
+    assert actual_query.endswith("ORDER BY wins DESC"), "Expected the leaderboard to be ordered by wins."
+
+
+def test_get_leaderboard_by_win_pct(mock_cursor):
+    """Test getting the leaderboard sorted by win percentage.
+
+    """
+    list(get_leaderboard("win_pct"))
+
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert actual_query.endswith("ORDER BY boxers.win_pct DESC"), "Expected the leaderboard to be ordered by the stored win_pct column."
+
+
+def test_get_leaderboard_is_lazy(mock_cursor):
+    """Test that the leaderboard is only queried once the caller starts iterating.
+
+    """
+    leaderboard = get_leaderboard()
+
+    mock_cursor.execute.assert_not_called()
+
+    assert list(leaderboard) == []
+    mock_cursor.fetchmany.assert_called_once_with(500)
+
+
+def test_get_leaderboard_real_db(real_db):
+    """Test the leaderboard SQL against SQLite: weight classes and win percentage rounding.
+
+    """
+    weights = [threshold + delta for threshold in WEIGHT_CLASS_THRESHOLDS for delta in (0, 0.5)]
+    create_boxers([(f"Boxer {i}", weight, 180, 70.5, 25) for i, weight in enumerate(weights)])
+
+    conn = sqlite3.connect(real_db)
+    # 1 win in 16 fights is 6.25%; SQLite's ROUND rounds the half up
+    conn.execute("UPDATE boxers SET fights = 16, wins = 1")
+    conn.commit()
+    conn.close()
+
+    leaderboard = list(get_leaderboard("win_pct"))
+
+    assert len(leaderboard) == len(weights)
+    for boxer in leaderboard:
+        assert boxer["weight_class"] == get_weight_class(boxer["weight"]), f"Weight class mismatch for {boxer['weight']}"
+        assert boxer["win_pct"] == 6.3
+
+
+def test_get_leaderboard_invalid_sort(mock_cursor):
+    """Test error when sorting the leaderboard by an unknown field.
+
+    """
+    with pytest.raises(ValueError, match="Invalid sort_by parameter: age"):
+        get_leaderboard("age")
+
+
+######################################################
+#
+#    Stats
+#
+######################################################
+
+
+def test_update_boxer_stats_win(mock_cursor):
+    """Test recording a win for a boxer.
+
+    """
+    mock_cursor.fetchone.return_value = (1,)
+
+    update_boxer_stats(1, "win")
+
+    expected_query = normalize_whitespace("UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ? RETURNING id")
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.execute.call_args[0][1] == (1, 1)
+
+    # The existence check is folded into the UPDATE
+    assert mock_cursor.execute.call_count == 1, "Expected a single SQL statement per stats update."
+
+
+def test_update_boxer_stats_loss(mock_cursor):
+    """Test recording a loss for a boxer.
+
+    """
+    mock_cursor.fetchone.return_value = (1,)
+
+    update_boxer_stats(1, "loss")
+
+    assert mock_cursor.execute.call_args[0][1] == (0, 1)
+    assert mock_cursor.execute.call_count == 1, "Expected a single SQL statement per stats update."
+
+
+def test_update_boxer_stats_bad_id(mock_cursor):
+    """Test error when updating stats for a non-existent boxer.
+
+    """
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        update_boxer_stats(999, "win")
+
+
+def test_update_boxer_stats_invalid_result():
+    """Test error when the fight result is not 'win' or 'loss'.
+
+    """
+    with pytest.raises(ValueError, match="Invalid result: draw. Expected 'win' or 'loss'."):
+        update_boxer_stats(1, "draw")
+
+
+def test_update_fight_result(mock_cursor):
+    """Test recording a fight result for both boxers with a single statement.
+
+    """
+    mock_cursor.fetchall.return_value = [(1,), (2,)]
+
+    update_fight_result(1, 2)
+
+    expected_query = normalize_whitespace("""
+        UPDATE boxers
+        SET fights = fights + 1,
+            wins = wins + CASE WHEN id = :w THEN 1 ELSE 0 END
+        WHERE id IN (:w, :l)
+        RETURNING id
+    """)
+    update_calls = [c for c in mock_cursor.execute.call_args_list if c[0][0].lstrip().startswith("UPDATE")]
+
+    assert len(update_calls) == 1, "Expected both boxers to be updated by one statement."
+    assert normalize_whitespace(update_calls[0][0][0]) == expected_query, "The SQL query did not match the expected structure."
+    assert update_calls[0][0][1] == {"w": 1, "l": 2}
+
+
+def test_update_fight_result_bad_id(mock_cursor):
+    """Test error when one of the boxers in the fight does not exist.
+
+    """
+    mock_cursor.fetchall.return_value = [(1,)]
+
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        update_fight_result(1, 999)
+
+
+def test_update_fight_result_same_boxer(mock_cursor):
+    """Test error when a boxer is recorded as fighting themselves.
+
+    """
+    with pytest.raises(ValueError, match="Boxer with ID 1 cannot fight themselves."):
+        update_fight_result(1, 1)
+
+    mock_cursor.execute.assert_not_called()
@@ -0,0 +1,190 @@
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from boxing.models.ring_model import RingModel
+from boxing.models.boxers_model import Boxer, update_fight_result
+
+
+# Error messages the ring raises, compiled once for every pytest.raises(match=...)
+INVALID_TYPE_RE = re.compile(r"Invalid type: Expected 'Boxer', got 'dict'")
+FULL_RING_RE = re.compile(r"Ring is full, cannot add more boxers\.")
+TWO_BOXERS_RE = re.compile(r"There must be two boxers to start a fight\.")
+ALREADY_IN_RING_RE = re.compile(r"Boxer 'Boxer 1' is already in the ring\.")
+
+@pytest.fixture()
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test."""
+    return RingModel()
+
+@pytest.fixture(autouse=True)
+def fixed_random(monkeypatch):
+    """Never call random.org from the ring tests; 0.0 always picks the first boxer."""
+    monkeypatch.setattr("boxing.models.ring_model.get_random", lambda: 0.0)
+
+@pytest.fixture(scope="module")
+def fight_result_stub():
+    """One stub for update_fight_result, built once and reused by every test in the module."""
+    return Mock(spec=update_fight_result)
+
+@pytest.fixture
+def mock_update_fight_result(monkeypatch, fight_result_stub):
+    """Install the update_fight_result stub with its call history cleared."""
+    fight_result_stub.reset_mock()
+    monkeypatch.setattr("boxing.models.ring_model.update_fight_result", fight_result_stub)
+    return fight_result_stub
+
+"""Fixtures providing sample boxers for the tests.
+
+Boxer is a frozen dataclass, so the samples are built once per module and shared.
+"""
+@pytest.fixture(scope="module")
+def sample_boxer1():
+    return Boxer(1, 'Boxer 1', 150, 180, 70.5, 25)
+
+@pytest.fixture(scope="module")
+def sample_boxer2():
+    return Boxer(2, 'Boxer 2', 210, 190, 78.0, 30)
+
+@pytest.fixture(scope="module")
+def sample_ring(sample_boxer1, sample_boxer2):
+    return (sample_boxer1, sample_boxer2)
+
+
+##################################################
+# Ring Management Test Cases
+##################################################
+
+
+@pytest.mark.parametrize("count, expect_full", [
+    (1, False),
+    (2, True),
+], ids=["add one", "add two full"])
+def test_add_boxer_to_ring(ring_model, sample_ring, sample_boxer1, count, expect_full):
+    """Test adding boxers to the ring, and that a full ring rejects a third.
+
+    """
+    for boxer in sample_ring[:count]:
+        ring_model.enter_ring(boxer)
+
+    assert ring_model.ring == list(sample_ring[:count])
+
+    if expect_full:
+        with pytest.raises(ValueError, match=FULL_RING_RE):
+            ring_model.enter_ring(sample_boxer1)
+
+    assert len(ring_model.ring) == count, f"Ring should still contain {count} boxer(s)."
+
+
+def test_add_bad_boxer_to_ring(ring_model):
+    """Test error when adding something that is not a Boxer to the ring.
+
+    """
+    with pytest.raises(TypeError, match=INVALID_TYPE_RE):
+        ring_model.enter_ring({})
+
+
+def test_add_same_boxer_to_ring_twice(ring_model, sample_boxer1):
+    """Test that a boxer cannot enter the ring twice, so they can never fight themselves.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match=ALREADY_IN_RING_RE):
+        ring_model.enter_ring(sample_boxer1)
+
+    assert ring_model.ring == [sample_boxer1], "Ring should still contain only the first entry."
+
+
+def test_clear_ring(ring_model, sample_ring):
+    """Test clearing the ring.
+
+    """
+    ring_model.ring.extend(sample_ring)
+
+    ring_model.clear_ring()
+    assert len(ring_model.ring) == 0, "Ring should be empty after clearing"
+
+
+def test_get_boxers(ring_model, sample_ring):
+    """Test retrieving the boxers in the ring.
+
+    """
+    ring_model.ring.extend(sample_ring)
+
+    boxers = ring_model.get_boxers()
+    assert boxers == list(sample_ring), f"Expected {list(sample_ring)}, got {boxers}"
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+def test_get_fighting_skill(ring_model, sample_boxer1):
+    """Test calculating the fighting skill of a boxer.
+
+    """
+    # 150 * len('Boxer 1') + 70.5 / 10 + 0
+    assert ring_model.get_fighting_skill(sample_boxer1) == pytest.approx(1057.05)
+
+
+def test_get_fighting_skill_is_cached(ring_model, sample_boxer2):
+    """Test that a boxer's skill is computed once and reused on later calls.
+
+    """
+    skill = ring_model.get_fighting_skill(sample_boxer2)
+
+    # Boxer.skill is a cached_property, so the value lives on the (module-scoped) instance
+    assert vars(sample_boxer2)["skill"] == skill
+    assert ring_model.get_fighting_skill(sample_boxer2) is skill
+
+
+@pytest.mark.parametrize("age, expected", [
+    (24, 1056.05),  # Under 25 loses a point
+    (30, 1057.05),
+    (36, 1055.05),  # Over 35 loses two points
+])
+def test_get_fighting_skill_age_modifier(ring_model, age, expected):
+    """Test the age modifier applied to the fighting skill.
+
+    """
+    boxer = Boxer(1, 'Boxer 1', 150, 180, 70.5, age)
+    assert ring_model.get_fighting_skill(boxer) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("random_number, winner_index", [
+    (0.0, 0),
+    (1.0, 1),
+], ids=["first boxer wins", "second boxer wins"])
+def test_fight(ring_model, sample_ring, mock_update_fight_result, monkeypatch, random_number, winner_index):
+    """Test a fight between the two boxers in the ring.
+
+    """
+    monkeypatch.setattr("boxing.models.ring_model.get_random", lambda: random_number)
+    winner, loser = sample_ring[winner_index], sample_ring[1 - winner_index]
+
+    ring_model.ring.extend(sample_ring)
+
+    assert ring_model.fight() == winner.name
+    mock_update_fight_result.assert_called_once_with(winner.id, loser.id)
+    assert len(ring_model.ring) == 0, "Ring should be empty after the fight."
+
+
+def test_fight_with_empty_ring(ring_model):
+    """Test error when starting a fight with an empty ring.
+
+    """
+    with pytest.raises(ValueError, match=TWO_BOXERS_RE):
+        ring_model.fight()
+
+
+def test_fight_with_one_boxer(ring_model, sample_boxer1):
+    """Test error when starting a fight with only one boxer.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match=TWO_BOXERS_RE):
+        ring_model.fight()
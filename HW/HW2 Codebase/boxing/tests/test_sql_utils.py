@@ -0,0 +1,117 @@
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+from boxing.utils.sql_utils import check_column_exists, close_db_pool, get_db_connection
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    """Point the connection pool at a fresh database file and close it after the test."""
+    monkeypatch.setattr(sql_utils, "DB_PATH", str(tmp_path / "boxing.db"))
+    monkeypatch.setattr(sql_utils, "_pool", None)
+    yield
+    close_db_pool()
+
+
+def pooled_connections():
+    return list(sql_utils._pool.queue)
+
+
+def test_get_db_connection_returns_connection_to_pool():
+    """Test that a connection goes back to the pool when the block exits.
+
+    """
+    with get_db_connection() as conn:
+        conn.execute("SELECT 1;")
+        assert sql_utils._pool.qsize() == sql_utils.DB_POOL_SIZE - 1
+
+    assert sql_utils._pool.qsize() == sql_utils.DB_POOL_SIZE, "Expected the connection to be returned to the pool."
+
+
+def test_get_db_connection_returns_connection_after_error():
+    """Test that a connection goes back to the pool when the block raises.
+
+    """
+    with pytest.raises(ValueError, match="boom"):
+        with get_db_connection():
+            raise ValueError("boom")
+
+    assert sql_utils._pool.qsize() == sql_utils.DB_POOL_SIZE, "Expected the connection to be returned to the pool."
+
+
+def test_get_db_connection_rolls_back_open_transaction():
+    """Test that a transaction left open is rolled back before the connection is reused.
+
+    """
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE boxers (id INTEGER PRIMARY KEY)")
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO boxers (id) VALUES (1)")
+        assert conn.in_transaction
+
+    assert not any(c.in_transaction for c in pooled_connections()), "Expected no pooled connection to hold a transaction."
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM boxers").fetchone() == (0,), "Expected the uncommitted insert to be rolled back."
+
+
+def test_get_db_connection_applies_pragmas():
+    """Test that every pooled connection is configured with the pragmas.
+
+    """
+    with get_db_connection():
+        pass
+
+    for conn in pooled_connections():
+        assert conn.execute("PRAGMA journal_mode;").fetchone() == ("wal",)
+        assert conn.execute("PRAGMA synchronous;").fetchone() == (1,)  # NORMAL
+        assert conn.execute("PRAGMA temp_store;").fetchone() == (2,)  # MEMORY
+        assert conn.execute("PRAGMA cache_size;").fetchone() == (-20000,)
+
+
+def test_get_db_connection_times_out_when_pool_is_exhausted(monkeypatch):
+    """Test that waiting on an exhausted pool fails clearly instead of blocking forever.
+
+    """
+    monkeypatch.setattr(sql_utils, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(sql_utils, "DB_POOL_TIMEOUT", 0.01)
+
+    with get_db_connection():
+        with pytest.raises(sqlite3.OperationalError, match="No database connection available"):
+            with get_db_connection():
+                pass
+
+    assert sql_utils._pool.qsize() == 1, "Expected the held connection to be returned to the pool."
+
+
+def test_close_db_pool():
+    """Test that closing the pool discards it so the next use builds a new one.
+
+    """
+    with get_db_connection():
+        pass
+
+    close_db_pool()
+
+    assert sql_utils._pool is None
+
+
+def test_check_column_exists(tmp_path, monkeypatch):
+    """Test the schema check for the stored win_pct column, including generated columns.
+
+    """
+    db_path = tmp_path / "schema.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript((Path(__file__).parent.parent / "sql" / "init_db.sql").read_text())
+    conn.execute("CREATE TABLE old_boxers (id INTEGER PRIMARY KEY, wins INTEGER)")
+    conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", str(db_path))
+
+    check_column_exists("boxers", "win_pct")
+
+    with pytest.raises(Exception, match="Column 'win_pct' does not exist in table 'old_boxers'"):
+        check_column_exists("old_boxers", "win_pct")